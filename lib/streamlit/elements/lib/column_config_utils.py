@@ -244,6 +244,31 @@ def _determine_data_kind_via_pandas_dtype(
     return ColumnDataKind.UNKNOWN
 
 
+# This mapping contains the inferred types returned by pandas' `infer_dtype`
+# mapped to the corresponding column data kind. Inferred types that are not
+# part of this mapping are treated as unknown.
+# TODO(lukasmasuch): Unused types: mixed, unknown-array, categorical, mixed-integer
+_INFERRED_TYPE_TO_DATA_KIND: Final[Dict[str, ColumnDataKind]] = {
+    "string": ColumnDataKind.STRING,
+    "bytes": ColumnDataKind.BYTES,
+    "floating": ColumnDataKind.FLOAT,
+    "mixed-integer-float": ColumnDataKind.FLOAT,
+    "integer": ColumnDataKind.INTEGER,
+    "decimal": ColumnDataKind.DECIMAL,
+    "complex": ColumnDataKind.COMPLEX,
+    "boolean": ColumnDataKind.BOOLEAN,
+    "datetime64": ColumnDataKind.DATETIME,
+    "datetime": ColumnDataKind.DATETIME,
+    "date": ColumnDataKind.DATE,
+    "timedelta64": ColumnDataKind.TIMEDELTA,
+    "timedelta": ColumnDataKind.TIMEDELTA,
+    "time": ColumnDataKind.TIME,
+    "period": ColumnDataKind.PERIOD,
+    "interval": ColumnDataKind.INTERVAL,
+    "empty": ColumnDataKind.EMPTY,
+}
+
+
 def _determine_data_kind_via_inferred_type(
     column: pd.Series | pd.Index,
 ) -> ColumnDataKind:
@@ -264,51 +289,7 @@ def _determine_data_kind_via_inferred_type(
     """
 
     inferred_type = pd.api.types.infer_dtype(column)
-
-    if inferred_type == "string":
-        return ColumnDataKind.STRING
-
-    if inferred_type == "bytes":
-        return ColumnDataKind.BYTES
-
-    if inferred_type in ["floating", "mixed-integer-float"]:
-        return ColumnDataKind.FLOAT
-
-    if inferred_type == "integer":
-        return ColumnDataKind.INTEGER
-
-    if inferred_type == "decimal":
-        return ColumnDataKind.DECIMAL
-
-    if inferred_type == "complex":
-        return ColumnDataKind.COMPLEX
-
-    if inferred_type == "boolean":
-        return ColumnDataKind.BOOLEAN
-
-    if inferred_type in ["datetime64", "datetime"]:
-        return ColumnDataKind.DATETIME
-
-    if inferred_type == "date":
-        return ColumnDataKind.DATE
-
-    if inferred_type in ["timedelta64", "timedelta"]:
-        return ColumnDataKind.TIMEDELTA
-
-    if inferred_type == "time":
-        return ColumnDataKind.TIME
-
-    if inferred_type == "period":
-        return ColumnDataKind.PERIOD
-
-    if inferred_type == "interval":
-        return ColumnDataKind.INTERVAL
-
-    if inferred_type == "empty":
-        return ColumnDataKind.EMPTY
-
-    # TODO(lukasmasuch): Unused types: mixed, unknown-array, categorical, mixed-integer
-    return ColumnDataKind.UNKNOWN
+    return _INFERRED_TYPE_TO_DATA_KIND.get(inferred_type, ColumnDataKind.UNKNOWN)
 
 
 def _determine_data_kind(
@@ -518,13 +499,16 @@ def apply_data_specific_configs(
 
 def _convert_column_config_to_json(column_config_mapping: ColumnConfigMapping) -> str:
     try:
-        # Ignore all None values and prefix columns specified by numerical index:
+        # Ignore all None values and prefix columns specified by numerical index.
+        # This is done in a single pass over all columns to avoid an intermediate
+        # copy of the full mapping:
         return json.dumps(
             {
                 (
                     f"{_NUMERICAL_POSITION_PREFIX}{str(k)}" if isinstance(k, int) else k
-                ): v
-                for (k, v) in remove_none_values(column_config_mapping).items()
+                ): (remove_none_values(v) if isinstance(v, dict) else v)
+                for (k, v) in column_config_mapping.items()
+                if v is not None
             },
             allow_nan=False,
         )
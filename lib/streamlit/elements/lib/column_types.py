@@ -15,9 +15,10 @@
 from __future__ import annotations
 
 import datetime
-from typing import Iterable, List, Union
+from functools import lru_cache
+from typing import Iterable, Mapping, TypeVar, Union, cast
 
-from typing_extensions import Literal, NotRequired, TypeAlias, TypedDict
+from typing_extensions import Final, Literal, NotRequired, TypeAlias, TypedDict
 
 from streamlit.runtime.metrics_util import gather_metrics
 
@@ -63,7 +64,7 @@ class CheckboxColumnConfig(TypedDict):
 
 class SelectboxColumnConfig(TypedDict):
     type: Literal["selectbox"]
-    options: NotRequired[List[str | int | float] | None]
+    options: NotRequired[list[str | int | float] | None]
 
 
 class LinkColumnConfig(TypedDict):
@@ -185,6 +186,42 @@ class ColumnConfig(TypedDict, total=False):
     ]
 
 
+# Column types without type-specific options always have the same type config.
+# These are shared between all columns of that type and must not be mutated.
+_CHECKBOX_TYPE_CONFIG: Final = CheckboxColumnConfig(type="checkbox")
+_IMAGE_TYPE_CONFIG: Final = ImageColumnConfig(type="image")
+_LIST_TYPE_CONFIG: Final = ListColumnConfig(type="list")
+
+_TypeConfigT = TypeVar("_TypeConfigT", bound=Mapping[str, object])
+
+
+def _remove_none_options(type_config: _TypeConfigT) -> _TypeConfigT:
+    """Remove all type-specific options that are not set (None)."""
+    return cast(_TypeConfigT, {k: v for k, v in type_config.items() if v is not None})
+
+
+@lru_cache(maxsize=256, typed=True)
+def _iso_cached(value: datetime.date | datetime.time) -> str:
+    """Convert a date, time, or datetime value to its ISO 8601 string.
+
+    The same bounds (e.g. today) are often used for many columns,
+    so the formatted strings are cached.
+    """
+    return value.isoformat()
+
+
+def _iso_or_none(value: datetime.date | datetime.time | None) -> str | None:
+    """Convert a date, time, or datetime value to its ISO 8601 string (or keep None)."""
+    if value is None:
+        return None
+    if getattr(value, "tzinfo", None) is not None:
+        # Timezone-aware values with different offsets compare (and hash) equal
+        # if they refer to the same point in time. They cannot share a cache
+        # entry since their ISO representation differs.
+        return value.isoformat()
+    return _iso_cached(value)
+
+
 @gather_metrics("column_config.Column")
 def Column(
     label: str | None = None,
@@ -255,9 +292,13 @@ def Column(
         https://doc-column.streamlit.app/
         height: 300px
     """
-    return ColumnConfig(
-        label=label, width=width, help=help, disabled=disabled, required=required
-    )
+    return {
+        "label": label,
+        "width": width,
+        "help": help,
+        "disabled": disabled,
+        "required": required,
+    }
 
 
 @gather_metrics("column_config.NumberColumn")
@@ -353,21 +394,23 @@ def NumberColumn(
         height: 300px
     """
 
-    return ColumnConfig(
-        label=label,
-        width=width,
-        help=help,
-        disabled=disabled,
-        required=required,
-        default=default,
-        type_config=NumberColumnConfig(
-            type="number",
-            min_value=min_value,
-            max_value=max_value,
-            format=format,
-            step=step,
+    return {
+        "label": label,
+        "width": width,
+        "help": help,
+        "disabled": disabled,
+        "required": required,
+        "default": default,
+        "type_config": _remove_none_options(
+            NumberColumnConfig(
+                type="number",
+                min_value=min_value,
+                max_value=max_value,
+                format=format,
+                step=step,
+            )
         ),
-    )
+    }
 
 
 @gather_metrics("column_config.TextColumn")
@@ -451,17 +494,17 @@ def TextColumn(
         height: 300px
     """
 
-    return ColumnConfig(
-        label=label,
-        width=width,
-        help=help,
-        disabled=disabled,
-        required=required,
-        default=default,
-        type_config=TextColumnConfig(
-            type="text", max_chars=max_chars, validate=validate
+    return {
+        "label": label,
+        "width": width,
+        "help": help,
+        "disabled": disabled,
+        "required": required,
+        "default": default,
+        "type_config": _remove_none_options(
+            TextColumnConfig(type="text", max_chars=max_chars, validate=validate)
         ),
-    )
+    }
 
 
 @gather_metrics("column_config.LinkColumn")
@@ -578,20 +621,22 @@ def LinkColumn(
         height: 300px
     """
 
-    return ColumnConfig(
-        label=label,
-        width=width,
-        help=help,
-        disabled=disabled,
-        required=required,
-        default=default,
-        type_config=LinkColumnConfig(
-            type="link",
-            max_chars=max_chars,
-            validate=validate,
-            display_text=display_text,
+    return {
+        "label": label,
+        "width": width,
+        "help": help,
+        "disabled": disabled,
+        "required": required,
+        "default": default,
+        "type_config": _remove_none_options(
+            LinkColumnConfig(
+                type="link",
+                max_chars=max_chars,
+                validate=validate,
+                display_text=display_text,
+            )
         ),
-    )
+    }
 
 
 @gather_metrics("column_config.CheckboxColumn")
@@ -665,15 +710,15 @@ def CheckboxColumn(
         height: 300px
     """
 
-    return ColumnConfig(
-        label=label,
-        width=width,
-        help=help,
-        disabled=disabled,
-        required=required,
-        default=default,
-        type_config=CheckboxColumnConfig(type="checkbox"),
-    )
+    return {
+        "label": label,
+        "width": width,
+        "help": help,
+        "disabled": disabled,
+        "required": required,
+        "default": default,
+        "type_config": _CHECKBOX_TYPE_CONFIG,
+    }
 
 
 @gather_metrics("column_config.SelectboxColumn")
@@ -762,17 +807,19 @@ def SelectboxColumn(
         height: 300px
     """
 
-    return ColumnConfig(
-        label=label,
-        width=width,
-        help=help,
-        disabled=disabled,
-        required=required,
-        default=default,
-        type_config=SelectboxColumnConfig(
-            type="selectbox", options=list(options) if options is not None else None
+    return {
+        "label": label,
+        "width": width,
+        "help": help,
+        "disabled": disabled,
+        "required": required,
+        "default": default,
+        "type_config": _remove_none_options(
+            SelectboxColumnConfig(
+                type="selectbox", options=list(options) if options is not None else None
+            )
         ),
-    )
+    }
 
 
 @gather_metrics("column_config.BarChartColumn")
@@ -847,12 +894,14 @@ def BarChartColumn(
         height: 300px
     """
 
-    return ColumnConfig(
-        label=label,
-        width=width,
-        help=help,
-        type_config=BarChartColumnConfig(type="bar_chart", y_min=y_min, y_max=y_max),
-    )
+    return {
+        "label": label,
+        "width": width,
+        "help": help,
+        "type_config": _remove_none_options(
+            BarChartColumnConfig(type="bar_chart", y_min=y_min, y_max=y_max)
+        ),
+    }
 
 
 @gather_metrics("column_config.LineChartColumn")
@@ -928,12 +977,14 @@ def LineChartColumn(
         height: 300px
     """
 
-    return ColumnConfig(
-        label=label,
-        width=width,
-        help=help,
-        type_config=LineChartColumnConfig(type="line_chart", y_min=y_min, y_max=y_max),
-    )
+    return {
+        "label": label,
+        "width": width,
+        "help": help,
+        "type_config": _remove_none_options(
+            LineChartColumnConfig(type="line_chart", y_min=y_min, y_max=y_max)
+        ),
+    }
 
 
 @gather_metrics("column_config.ImageColumn")
@@ -942,7 +993,7 @@ def ImageColumn(
     *,
     width: ColumnWidth | None = None,
     help: str | None = None,
-):
+) -> ColumnConfig:
     """Configure an image column in ``st.dataframe`` or ``st.data_editor``.
 
     The cell values need to be one of:
@@ -1002,9 +1053,12 @@ def ImageColumn(
         https://doc-image-column.streamlit.app/
         height: 300px
     """
-    return ColumnConfig(
-        label=label, width=width, help=help, type_config=ImageColumnConfig(type="image")
-    )
+    return {
+        "label": label,
+        "width": width,
+        "help": help,
+        "type_config": _IMAGE_TYPE_CONFIG,
+    }
 
 
 @gather_metrics("column_config.ListColumn")
@@ -1013,7 +1067,7 @@ def ListColumn(
     *,
     width: ColumnWidth | None = None,
     help: str | None = None,
-):
+) -> ColumnConfig:
     """Configure a list column in ``st.dataframe`` or ``st.data_editor``.
 
     This is the default column type for list-like values. List columns are not editable
@@ -1067,9 +1121,12 @@ def ListColumn(
         https://doc-list-column.streamlit.app/
         height: 300px
     """
-    return ColumnConfig(
-        label=label, width=width, help=help, type_config=ListColumnConfig(type="list")
-    )
+    return {
+        "label": label,
+        "width": width,
+        "help": help,
+        "type_config": _LIST_TYPE_CONFIG,
+    }
 
 
 @gather_metrics("column_config.DatetimeColumn")
@@ -1175,22 +1232,26 @@ def DatetimeColumn(
         height: 300px
     """
 
-    return ColumnConfig(
-        label=label,
-        width=width,
-        help=help,
-        disabled=disabled,
-        required=required,
-        default=None if default is None else default.isoformat(),
-        type_config=DatetimeColumnConfig(
-            type="datetime",
-            format=format,
-            min_value=None if min_value is None else min_value.isoformat(),
-            max_value=None if max_value is None else max_value.isoformat(),
-            step=step.total_seconds() if isinstance(step, datetime.timedelta) else step,
-            timezone=timezone,
+    return {
+        "label": label,
+        "width": width,
+        "help": help,
+        "disabled": disabled,
+        "required": required,
+        "default": _iso_or_none(default),
+        "type_config": _remove_none_options(
+            DatetimeColumnConfig(
+                type="datetime",
+                format=format,
+                min_value=_iso_or_none(min_value),
+                max_value=_iso_or_none(max_value),
+                step=step.total_seconds()
+                if isinstance(step, datetime.timedelta)
+                else step,
+                timezone=timezone,
+            )
         ),
-    )
+    }
 
 
 @gather_metrics("column_config.TimeColumn")
@@ -1290,21 +1351,25 @@ def TimeColumn(
         height: 300px
     """
 
-    return ColumnConfig(
-        label=label,
-        width=width,
-        help=help,
-        disabled=disabled,
-        required=required,
-        default=None if default is None else default.isoformat(),
-        type_config=TimeColumnConfig(
-            type="time",
-            format=format,
-            min_value=None if min_value is None else min_value.isoformat(),
-            max_value=None if max_value is None else max_value.isoformat(),
-            step=step.total_seconds() if isinstance(step, datetime.timedelta) else step,
+    return {
+        "label": label,
+        "width": width,
+        "help": help,
+        "disabled": disabled,
+        "required": required,
+        "default": _iso_or_none(default),
+        "type_config": _remove_none_options(
+            TimeColumnConfig(
+                type="time",
+                format=format,
+                min_value=_iso_or_none(min_value),
+                max_value=_iso_or_none(max_value),
+                step=step.total_seconds()
+                if isinstance(step, datetime.timedelta)
+                else step,
+            )
         ),
-    )
+    }
 
 
 @gather_metrics("column_config.DateColumn")
@@ -1403,21 +1468,23 @@ def DateColumn(
         https://doc-date-column.streamlit.app/
         height: 300px
     """
-    return ColumnConfig(
-        label=label,
-        width=width,
-        help=help,
-        disabled=disabled,
-        required=required,
-        default=None if default is None else default.isoformat(),
-        type_config=DateColumnConfig(
-            type="date",
-            format=format,
-            min_value=None if min_value is None else min_value.isoformat(),
-            max_value=None if max_value is None else max_value.isoformat(),
-            step=step,
+    return {
+        "label": label,
+        "width": width,
+        "help": help,
+        "disabled": disabled,
+        "required": required,
+        "default": _iso_or_none(default),
+        "type_config": _remove_none_options(
+            DateColumnConfig(
+                type="date",
+                format=format,
+                min_value=_iso_or_none(min_value),
+                max_value=_iso_or_none(max_value),
+                step=step,
+            )
         ),
-    )
+    }
 
 
 @gather_metrics("column_config.ProgressColumn")
@@ -1494,14 +1561,16 @@ def ProgressColumn(
         height: 300px
     """
 
-    return ColumnConfig(
-        label=label,
-        width=width,
-        help=help,
-        type_config=ProgressColumnConfig(
-            type="progress",
-            format=format,
-            min_value=min_value,
-            max_value=max_value,
+    return {
+        "label": label,
+        "width": width,
+        "help": help,
+        "type_config": _remove_none_options(
+            ProgressColumnConfig(
+                type="progress",
+                format=format,
+                min_value=min_value,
+                max_value=max_value,
+            )
         ),
-    )
+    }
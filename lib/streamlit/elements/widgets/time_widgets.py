@@ -685,7 +685,8 @@ class TimeWidgetsMixin:
         parsed: str | None | List[str | None]
         if value == "today" or value is None:
             parsed = None
-        elif isinstance(value, (datetime, date)):
+        elif isinstance(value, date):
+            # This also covers datetime values since datetime is a subclass of date.
             parsed = parse_date_deterministic(value)
         else:
             parsed = [parse_date_deterministic(cast(SingleDateValue, v)) for v in value]
@@ -105,6 +105,14 @@ class ColumnTypesTest(unittest.TestCase):
             "Should have all the properties defined.",
         )
 
+    def test_type_config_without_unset_options(self):
+        """Test that options that are not set are not part of the type config."""
+        self.assertEqual(
+            NumberColumn(min_value=0)["type_config"],
+            {"type": "number", "min_value": 0},
+            "Should only contain the type and the options that are set.",
+        )
+
     def test_text_column(self):
         """Test TextColumn creation."""
 
@@ -250,6 +258,39 @@ class ColumnTypesTest(unittest.TestCase):
             "Should have all the properties defined.",
         )
 
+    def test_datetime_column_with_timezone(self):
+        """Test that equal datetimes with different offsets keep their own offset."""
+        utc_value = datetime.datetime(2021, 1, 1, 12, 0, tzinfo=datetime.timezone.utc)
+        cet_value = datetime.datetime(
+            2021, 1, 1, 13, 0, tzinfo=datetime.timezone(datetime.timedelta(hours=1))
+        )
+        # Both values refer to the same point in time:
+        self.assertEqual(utc_value, cet_value)
+
+        self.assertEqual(
+            DatetimeColumn(default=utc_value)["default"],
+            "2021-01-01T12:00:00+00:00",
+        )
+        self.assertEqual(
+            DatetimeColumn(default=cet_value)["default"],
+            "2021-01-01T13:00:00+01:00",
+        )
+
+    def test_date_and_time_types_are_converted_separately(self):
+        """Test that datetime, date and time values are not mixed up when converted."""
+        self.assertEqual(
+            DatetimeColumn(default=datetime.datetime(2021, 1, 1))["default"],
+            "2021-01-01T00:00:00",
+        )
+        self.assertEqual(
+            DateColumn(default=datetime.date(2021, 1, 1))["default"],
+            "2021-01-01",
+        )
+        self.assertEqual(
+            TimeColumn(default=datetime.time(0, 0))["default"],
+            "00:00:00",
+        )
+
     def test_time_column(self):
         """Test TimeColumn creation."""
 